@@ -1,9 +1,96 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import yfinance as yf
-from bond_utils import get_bond_data
-from visualization import create_pie_chart, create_bar_chart, create_ladder_chart
+from bond_utils import get_bond_data, clear_disk_cache
+from visualization import cached_pie_chart, cached_bar_chart, cached_ladder_chart
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_bond_data():
+    """
+    Memoized wrapper around get_bond_data().
+
+    Caches the fetched DataFrame across Streamlit reruns so widget
+    interactions don't trigger fresh yfinance round-trips. The one-hour
+    TTL only bounds how often get_bond_data() is re-entered; its on-disk
+    daily cache means quotes can still be up to a day old unless the
+    user forces a refresh.
+
+    Returns:
+        pd.DataFrame: Current bond fund information.
+    """
+    return get_bond_data()
+
+# Static markdown blocks, allocated once at import time instead of on
+# every rerun
+_FUND_LIST_MD = """
+The allocation will be calculated using these bond funds:
+- **BND**: Vanguard Total Bond Market ETF
+- **BNDX**: Vanguard Total International Bond ETF
+- **VCORX**: Vanguard Core Bond Fund Investor Shares
+- **VFIDX**: Vanguard Intermediate-Term Investment-Grade Fund
+- **VFSUX**: Vanguard Short-Term Investment-Grade Fund
+- **VGUS**: Vanguard Ultra-Short Treasury ETF (1-12 months)
+- **VBIL**: Vanguard Ultra-Short Treasury Bills ETF (0-3 months)
+"""
+
+_BOND_EXPLAINER_MD = """
+    ### Bond Quality
+    
+    Bond quality, often referred to as credit quality, indicates the likelihood that a bond issuer will 
+    default on its debt obligations. Bonds are typically rated by credit rating agencies (e.g., Moody's, 
+    Standard & Poor's) from highest (e.g., AAA) to lowest (e.g., D).
+    
+    -   **Investment Grade Bonds**: These are bonds issued by financially stable entities with a low 
+        risk of default. They typically offer lower yields but are considered safer.
+    -   **High-Yield (Junk) Bonds**: These are bonds issued by companies or governments with a higher 
+        risk of default. They offer higher yields to compensate investors for the increased risk.
+    
+    ### Bond Maturity and Interest Rate Sensitivity
+    
+    **Maturity** refers to the length of time until the bond's principal is repaid to the investor. 
+    Bonds can have short-term (e.g., less than 3 years), intermediate-term (e.g., 3-10 years), or 
+    long-term (e.g., over 10 years) maturities.
+    
+    **Interest Rate Sensitivity** (or duration) describes how much a bond's price is likely to change 
+    when interest rates move.
+    
+    -   **Inverse Relationship**: Bond prices and interest rates generally move in opposite directions. 
+        When interest rates rise, existing bond prices fall (and vice-versa).
+    -   **Longer Maturity = Higher Sensitivity**: Bonds with longer maturities are more sensitive to 
+        changes in interest rates. A small change in interest rates will have a larger impact on the 
+        price of a long-term bond than on a short-term bond.
+    
+    ### Bonds vs. Stocks: Historical Relationship
+    
+    Historically, bonds and stocks have often exhibited a low or negative correlation, meaning they tend 
+    to move in different directions or have less synchronized movements.
+    
+    -   **Diversification**: This low correlation makes bonds a valuable diversification tool in a 
+        portfolio. When stocks perform poorly, bonds may hold their value or even increase, providing 
+        a cushion against overall portfolio losses.
+    -   **Risk and Return**: Stocks generally offer higher potential returns over the long term but come 
+        with higher volatility and risk. Bonds typically offer lower, more stable returns with less 
+        volatility, making them suitable for capital preservation and income generation.
+    """
+
+_DISCLAIMER_MD = """
+**Disclaimer**: This tool provides general investment information and not personalized investment advice. 
+Past performance is not indicative of future results. Consider consulting with a financial advisor before 
+making investment decisions.
+"""
+
+
+@st.fragment
+def _info_section():
+    """
+    Render the static bond education expander.
+
+    As a fragment, reruns triggered elsewhere in the app skip
+    re-serializing this block.
+    """
+    with st.expander("Bond Quality and Maturity Explained."):
+        st.markdown(_BOND_EXPLAINER_MD)
 
 # Set page configuration
 st.set_page_config(
@@ -59,7 +146,8 @@ for symbol in bond_symbols:
     )
 
 # Check if total allocation is 100%
-total_allocation = sum(allocations_pct.values())
+allocation_values = np.fromiter(allocations_pct.values(), dtype=np.float64)
+total_allocation = float(allocation_values.sum())
 if abs(total_allocation - 100.0) > 0.01:  # Use a small tolerance for float comparison
     st.sidebar.warning(f"Total allocation is {total_allocation:.2f}%. It must equal 100%.")
 else:
@@ -68,140 +156,149 @@ else:
 
 # Bond fund selection
 st.sidebar.subheader("Bond Funds")
-st.sidebar.markdown("""
-The allocation will be calculated using these bond funds:
-- **BND**: Vanguard Total Bond Market ETF
-- **BNDX**: Vanguard Total International Bond ETF
-- **VCORX**: Vanguard Core Bond Fund Investor Shares
-- **VFIDX**: Vanguard Intermediate-Term Investment-Grade Fund
-- **VFSUX**: Vanguard Short-Term Investment-Grade Fund
-- **VGUS**: Vanguard Ultra-Short Treasury ETF (1-12 months)
-- **VBIL**: Vanguard Ultra-Short Treasury Bills ETF (0-3 months)
-""")
+st.sidebar.markdown(_FUND_LIST_MD)
+
+# Allow the user to force a re-pull of quotes past every cache layer:
+# session state, st.cache_data and the on-disk daily cache. Deleting the
+# disk entry (rather than just skipping the read) lets the forced fetch
+# write a fresh parquet that other sessions pick up too
+if st.sidebar.button("Refresh quotes"):
+    st.cache_data.clear()
+    clear_disk_cache()
+    st.session_state['bond_data'] = get_bond_data()
 
 # Informational section - collapsible
-with st.expander("Bond Quality and Maturity Explained."):
-    st.markdown("""
-    ### Bond Quality
-    
-    Bond quality, often referred to as credit quality, indicates the likelihood that a bond issuer will 
-    default on its debt obligations. Bonds are typically rated by credit rating agencies (e.g., Moody's, 
-    Standard & Poor's) from highest (e.g., AAA) to lowest (e.g., D).
-    
-    -   **Investment Grade Bonds**: These are bonds issued by financially stable entities with a low 
-        risk of default. They typically offer lower yields but are considered safer.
-    -   **High-Yield (Junk) Bonds**: These are bonds issued by companies or governments with a higher 
-        risk of default. They offer higher yields to compensate investors for the increased risk.
-    
-    ### Bond Maturity and Interest Rate Sensitivity
-    
-    **Maturity** refers to the length of time until the bond's principal is repaid to the investor. 
-    Bonds can have short-term (e.g., less than 3 years), intermediate-term (e.g., 3-10 years), or 
-    long-term (e.g., over 10 years) maturities.
-    
-    **Interest Rate Sensitivity** (or duration) describes how much a bond's price is likely to change 
-    when interest rates move.
-    
-    -   **Inverse Relationship**: Bond prices and interest rates generally move in opposite directions. 
-        When interest rates rise, existing bond prices fall (and vice-versa).
-    -   **Longer Maturity = Higher Sensitivity**: Bonds with longer maturities are more sensitive to 
-        changes in interest rates. A small change in interest rates will have a larger impact on the 
-        price of a long-term bond than on a short-term bond.
-    
-    ### Bonds vs. Stocks: Historical Relationship
-    
-    Historically, bonds and stocks have often exhibited a low or negative correlation, meaning they tend 
-    to move in different directions or have less synchronized movements.
-    
-    -   **Diversification**: This low correlation makes bonds a valuable diversification tool in a 
-        portfolio. When stocks perform poorly, bonds may hold their value or even increase, providing 
-        a cushion against overall portfolio losses.
-    -   **Risk and Return**: Stocks generally offer higher potential returns over the long term but come 
-        with higher volatility and risk. Bonds typically offer lower, more stable returns with less 
-        volatility, making them suitable for capital preservation and income generation.
-    """)
+_info_section()
 
 # Main content
 
-# Fetch bond data
-with st.spinner("Fetching latest bond fund data..."):
-    try:
-        bond_data = get_bond_data()
+@st.fragment
+def _render_results(allocations_pct, investment_amount):
+    """
+    Render the bond data table, charts and returns summary.
+
+    Isolated as a fragment so interactions scoped to this block rerun
+    only the results section instead of the whole script.
+
+    Args:
+        allocations_pct (dict): Fund symbol to allocation percentage.
+        investment_amount (int): Total amount to invest in dollars.
+    """
+    with st.spinner("Fetching latest bond fund data..."):
+        try:
+            # Keep the fetched data in session state so within-session
+            # reruns never depend on the process-wide cache surviving
+            if 'bond_data' not in st.session_state:
+                st.session_state['bond_data'] = _cached_bond_data()
+            bond_data = st.session_state['bond_data']
+
+            # Pull the yield column out as an aligned NumPy array once, so
+            # later math indexes plain arrays instead of going through the
+            # pandas label indexer per fund
+            fund_symbols = bond_data.index.to_numpy()
+            fund_yields = bond_data['Yield (%)'].to_numpy(dtype=np.float64)
         
-        # Display bond data in table
-        st.subheader("Current Bond Fund Information")
-        # Format 'Current Price ($)' and 'Yield (%)' columns to two decimal places for display
-        bond_data_display = bond_data.copy()
-        bond_data_display['Current Price ($)'] = bond_data_display['Current Price ($)'].apply(lambda x: f"{x:.2f}" if pd.notna(x) else "N/A")
-        bond_data_display['Expense Ratio (%)'] = bond_data_display['Expense Ratio (%)'].apply(lambda x: f"{x:.2f}" if pd.notna(x) else "N/A")
-        bond_data_display['Yield (%)'] = bond_data_display['Yield (%)'].apply(lambda x: f"{x:.2f}" if pd.notna(x) else "N/A")
-        st.dataframe(bond_data_display)
+            # Display bond data in table
+            st.subheader("Current Bond Fund Information")
+            # Keep the numeric columns as float64 and let the frontend apply
+            # the two-decimal formatting, so no stringified copy is built or
+            # shipped on reruns
+            st.dataframe(
+                bond_data,
+                column_config={
+                    'Current Price ($)': st.column_config.NumberColumn(format="%.2f"),
+                    'Expense Ratio (%)': st.column_config.NumberColumn(format="%.2f"),
+                    'Yield (%)': st.column_config.NumberColumn(format="%.2f"),
+                    # Internal precomputed column; not for display
+                    'MaturityMid': None
+                }
+            )
         
-        # Create allocation dictionary from user inputs
-        allocation = {symbol: pct / 100.0 for symbol, pct in allocations_pct.items()}
+            # Create allocation dictionary from user inputs, pruned to the
+            # funds actually allocated so the charts and table don't carry
+            # zero-weight entries
+            allocation = {
+                symbol: pct / 100.0
+                for symbol, pct in allocations_pct.items() if pct > 0
+            }
+            # Hashable form of the allocation for the cached chart builders
+            allocation_items = tuple(sorted(allocation.items()))
+
+            # Convert the allocation to arrays once; the table and the
+            # yield math below reuse these instead of re-walking the dict
+            funds = list(allocation.keys())
+            weights = np.fromiter(allocation.values(), dtype=np.float64)
+            fund_positions = {symbol: i for i, symbol in enumerate(fund_symbols)}
+            fund_selector = [fund_positions[f] for f in funds]
 
-        # Display results only if the allocation is 100%
-        if abs(total_allocation - 100.0) < 0.01:
-            # Display results in columns
-            col1, col2 = st.columns(2)
+            # Group the results into one container so the frontend diff
+            # stays local to a single node per rerun
+            with st.container(border=True):
+                # Display results in columns
+                col1, col2 = st.columns(2)
             
-            with col1:
-                st.subheader("Bond Allocation")
-                # Display pie chart of allocation
-                fig_pie = create_pie_chart(allocation)
-                st.plotly_chart(fig_pie, use_container_width=True)
+                with col1:
+                    st.subheader("Bond Allocation")
+                    # Display pie chart of allocation
+                    fig_pie = cached_pie_chart(allocation_items)
+                    st.plotly_chart(fig_pie, use_container_width=True)
             
-            with col2:
-                st.subheader("Allocation by Maturity")
-                # Display bar chart by maturity
-                fig_bar = create_bar_chart(allocation, bond_data)
-                st.plotly_chart(fig_bar, use_container_width=True)
+                with col2:
+                    st.subheader("Allocation by Maturity")
+                    # Display bar chart by maturity
+                    fig_bar = cached_bar_chart(allocation_items, bond_data)
+                    st.plotly_chart(fig_bar, use_container_width=True)
             
-            # Display allocation table
-            st.subheader("Detailed Allocation")
+                # Display allocation table
+                st.subheader("Detailed Allocation")
             
-            # Create allocation table
-            allocation_table = pd.DataFrame({
-                "Fund": allocation.keys(),
-                "Allocation (%)": [round(val * 100, 2) for val in allocation.values()],
-                "Amount ($)": [round(val * investment_amount, 2) for val in allocation.values()]
-            })
+                # Create allocation table from the precomputed weight arrays
+                allocation_table = pd.DataFrame({
+                    "Fund": funds,
+                    "Allocation (%)": np.round(weights * 100, 2),
+                    "Amount ($)": np.round(weights * investment_amount, 2)
+                })
             
-            st.dataframe(allocation_table)
+                st.dataframe(allocation_table)
             
-            # Display ladder visualization
-            st.subheader("Amount Vs. Maturity")
-            fig_ladder = create_ladder_chart(allocation, bond_data, investment_amount)
-            st.plotly_chart(fig_ladder, use_container_width=True)
+                # Display ladder visualization
+                st.subheader("Amount Vs. Maturity")
+                fig_ladder = cached_ladder_chart(allocation_items, bond_data, investment_amount)
+                st.plotly_chart(fig_ladder, use_container_width=True)
             
-            # Expected returns section
-            st.subheader("Expected Returns and Considerations")
+                # Expected returns section
+                st.subheader("Expected Returns and Considerations")
             
-            # Calculate weighted average yield
-            weighted_yield = sum(allocation[fund] * bond_data.loc[fund, 'Yield (%)'] for fund in allocation if allocation[fund] > 0 and fund in bond_data.index)
+                # Calculate weighted average yield as a single dot product over
+                # the precomputed weight and yield arrays
+                weighted_yield = float(weights @ np.nan_to_num(fund_yields)[fund_selector])
             
-            st.markdown(f"""
-            - **Estimated Annual Yield**: {weighted_yield:.2f}%
-            - **Estimated Annual Income**: ${(weighted_yield/100 * investment_amount):.2f}
+                st.markdown(f"""
+                - **Estimated Annual Yield**: {weighted_yield:.2f}%
+                - **Estimated Annual Income**: ${(weighted_yield/100 * investment_amount):.2f}
             
-            **Important Considerations**:
+                **Important Considerations**:
             
-            - Bond prices move inversely to interest rates
-            - Longer-term bonds generally offer higher yields but with increased interest rate risk
-            - Diversification across different bond types helps manage overall portfolio risk
-            - Review and rebalance your bond ladder periodically, especially as bonds mature
-            """)
-        else:
-            st.error("Total allocation must be 100% to calculate and display the portfolio.")
+                - Bond prices move inversely to interest rates
+                - Longer-term bonds generally offer higher yields but with increased interest rate risk
+                - Diversification across different bond types helps manage overall portfolio risk
+                - Review and rebalance your bond ladder periodically, especially as bonds mature
+                """)
         
-    except Exception as e:
-        st.error(f"Error processing bond data: {str(e)}")
-        st.info("Please try again later or check your input parameters.")
+        except Exception as e:
+            st.error(f"Error processing bond data: {str(e)}")
+            st.info("Please try again later or check your input parameters.")
+
+
+# Skip the entire fetch-and-render path while the allocation is mid-edit;
+# st.stop() halts the script before any bond data is requested
+if abs(total_allocation - 100.0) > 0.01:
+    st.error("Total allocation must be 100% to calculate and display the portfolio.")
+    st.stop()
+
+# Render the main results section as an isolated fragment
+_render_results(allocations_pct, investment_amount)
 
 # Footer
 st.markdown("---")
-st.markdown("""
-**Disclaimer**: This tool provides general investment information and not personalized investment advice. 
-Past performance is not indicative of future results. Consider consulting with a financial advisor before 
-making investment decisions.
-""")
+st.markdown(_DISCLAIMER_MD)
@@ -1,140 +1,212 @@
+import hashlib
 import pandas as pd
 import numpy as np
-import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
 
-def get_bond_data():
+# On-disk cache so bond data survives server restarts; entries are keyed
+# on the fund list and the current date, giving an effective 1-day TTL
+_CACHE_DIR = Path(".cache/bonds")
+
+# List of bond funds
+BOND_FUNDS = ["BND", "BNDX", "VCORX", "VFIDX", "VFSUX", "VGUS", "VBIL"]
+
+# Map display names
+DISPLAY_NAMES = {
+    "BND": "Vanguard Total Bond Market ETF",
+    "BNDX": "Vanguard Total International Bond ETF",
+    "VFIDX": "Vanguard Intermediate-Term Investment-Grade Fund",
+    "VFSUX": "Vanguard Short-Term Investment-Grade Fund",
+    "VGUS": "Vanguard Ultra-Short Treasury ETF",  # 1-12 months maturity
+    "VBIL": "Vanguard Ultra-Short Treasury Bills ETF",  # 0-3 months maturity
+    "VCORX": "Vanguard Core Bond Fund Investor Shares"
+}
+
+# Map maturity ranges (in years)
+MATURITY_RANGES = {
+    "BND": "7-8",
+    "BNDX": "8-9",
+    "VFIDX": "5-6",
+    "VFSUX": "2-3",
+    "VGUS": "0-1",  # Ultra-short-term Treasury (1-12 months)
+    "VBIL": "0-0.25",  # Ultra-short Treasury Bills (0-3 months)
+    "VCORX": "8-10"
+}
+
+# Map credit quality
+CREDIT_QUALITY = {
+    "BND": "Mixed Investment Grade",
+    "BNDX": "Mixed Investment Grade",
+    "VFIDX": "Investment Grade",
+    "VFSUX": "Investment Grade",
+    "VGUS": "U.S. Treasury",  # Highest quality
+    "VBIL": "U.S. Treasury Bills",  # Highest quality, shortest term
+    "VCORX": "Mixed Investment Grade"
+}
+
+# Fallback values used when a quote is unavailable or a field is missing
+FALLBACK_PRICES = {
+    "BND": 72.50,
+    "BNDX": 48.75,
+    "VFIDX": 9.40,
+    "VFSUX": 9.60,
+    "VGUS": 60.25,
+    "VBIL": 50.80,
+    "VCORX": 9.01
+}
+
+FALLBACK_YIELDS = {
+    "BND": 4.2,
+    "BNDX": 3.8,
+    "VFIDX": 4.8,
+    "VFSUX": 4.5,
+    "VGUS": 4.3,
+    "VBIL": 4.0,
+    "VCORX": 4.62
+}
+
+FALLBACK_ER = {
+    "BND": 0.03,
+    "BNDX": 0.07,
+    "VCORX": 0.20,
+    "VFIDX": 0.10,
+    "VFSUX": 0.10,
+    "VGUS": 0.07,
+    "VBIL": 0.07
+}
+
+# Static per-fund metadata assembled once at import time; get_bond_data
+# starts from a copy of this frame and overlays the live quote columns
+BOND_META = pd.DataFrame({
+    'Name': DISPLAY_NAMES,
+    'Maturity Range (years)': MATURITY_RANGES,
+    'Credit Quality': CREDIT_QUALITY
+}).reindex(BOND_FUNDS)
+
+# Parse the maturity-range midpoints once at import so chart renders
+# don't re-split the same strings on every interaction
+BOND_META['MaturityMid'] = (BOND_META['Maturity Range (years)']
+                            .str.split('-', expand=True)
+                            .astype(float)
+                            .mean(axis=1))
+
+
+def clear_disk_cache():
+    """
+    Delete all on-disk cache entries so the next fetch hits the network.
+
+    Used by the app's refresh path; without this, other sessions (and
+    restarts) would keep reading the stale parquet for the rest of the day.
+    """
+    if _CACHE_DIR.exists():
+        for entry in _CACHE_DIR.glob("*.parquet"):
+            try:
+                entry.unlink()
+            except OSError:
+                # Best-effort; a concurrent fetch may have removed it
+                pass
+
+
+def get_bond_data(use_cache=True):
     """
     Fetch current data for the bond funds used in the ladder
+
+    Args:
+        use_cache (bool): Read/write the on-disk daily cache. Disable to
+            force a live fetch.
+
+    Returns:
+        pd.DataFrame: Bond fund information indexed by ticker symbol.
     """
-    # List of bond funds
-    bond_funds = ["BND", "BNDX", "VCORX", "VFIDX", "VFSUX", "VGUS", "VBIL"]
-    
-    # Map display names
-    display_names = {
-        "BND": "Vanguard Total Bond Market ETF",
-        "BNDX": "Vanguard Total International Bond ETF",
-        "VFIDX": "Vanguard Intermediate-Term Investment-Grade Fund",
-        "VFSUX": "Vanguard Short-Term Investment-Grade Fund",
-        "VGUS": "Vanguard Ultra-Short Treasury ETF",  # 1-12 months maturity
-        "VBIL": "Vanguard Ultra-Short Treasury Bills ETF",  # 0-3 months maturity
-        "VCORX": "Vanguard Core Bond Fund Investor Shares"
-    }
-    
-    # Map maturity ranges (in years)
-    maturity_ranges = {
-        "BND": "7-8",
-        "BNDX": "8-9",
-        "VFIDX": "5-6",
-        "VFSUX": "2-3",
-        "VGUS": "0-1",  # Ultra-short-term Treasury (1-12 months)
-        "VBIL": "0-0.25",  # Ultra-short Treasury Bills (0-3 months)
-        "VCORX": "8-10"
-    }
-    
-    # Map credit quality
-    credit_quality = {
-        "BND": "Mixed Investment Grade",
-        "BNDX": "Mixed Investment Grade",
-        "VFIDX": "Investment Grade",
-        "VFSUX": "Investment Grade",
-        "VGUS": "U.S. Treasury",  # Highest quality
-        "VBIL": "U.S. Treasury Bills",  # Highest quality, shortest term
-        "VCORX": "Mixed Investment Grade"
-    }
-    
-    # Create DataFrame
-    bond_data = pd.DataFrame(index=bond_funds)
-    
+    # Deferred import: yfinance is only needed on an actual fetch, so the
+    # app's cold start doesn't pay for loading it
+    import yfinance as yf
+
+    bond_funds = BOND_FUNDS
+
+    # Return the cached copy if today's data is already on disk
+    cache_key = hashlib.md5(f"{sorted(bond_funds)}|{date.today()}".encode()).hexdigest()
+    cache_file = _CACHE_DIR / f"{cache_key}.parquet"
+    if use_cache and cache_file.exists():
+        try:
+            return pd.read_parquet(cache_file)
+        except Exception:
+            # Unreadable cache entry; fall through to a live fetch
+            pass
+
     try:
-        # Fetch data for each fund
-        for fund in bond_funds:
-            ticker = yf.Ticker(fund)
+        # One shared handle for all funds; per-fund lookups reuse it
+        tickers = yf.Tickers(" ".join(bond_funds))
+
+        def _fetch_one(fund):
+            """
+            Fetch quote fields for a single fund; runs in a worker thread.
+
+            Args:
+                fund (str): Fund ticker symbol.
+
+            Returns:
+                dict: Live quote columns for this fund.
+            """
+            ticker = tickers.tickers[fund]
             info = ticker.info
-            
-            # Get recent price data
-            hist = ticker.history(period="1mo")
-            
+
+            # Only the latest price is needed, so read the scalar quote
+            # fields instead of downloading a month of OHLCV history.
+            # FastInfo.get() only recognizes the camelCase key names
+            price = ticker.fast_info.get('lastPrice') or info.get('regularMarketPrice') or np.nan
+
             # Calculate yield (this is an approximation)
             if 'yield' in info and info['yield'] is not None:
                 yield_value = info['yield'] * 100
             else:
-                # Fallback yields if not available
-                fallback_yields = {
-                    "BND": 4.2,
-                    "BNDX": 3.8,
-                    "VFIDX": 4.8,
-                    "VFSUX": 4.5,
-                    "VGUS": 4.3,
-                    "VBIL": 4.0,
-                    "VCORX": 4.62
-                }
-                yield_value = fallback_yields[fund]
+                yield_value = FALLBACK_YIELDS[fund]
 
             # Get expense ratio
             if 'netExpenseRatio' in info and info['netExpenseRatio'] is not None:
                 er_value = info['netExpenseRatio']
             else:
-                fallback_er = {
-                    "BND": 0.03,
-                    "BNDX": 0.07,
-                    "VCORX": 0.20,
-                    "VFIDX": 0.10,
-                    "VFSUX": 0.10,
-                    "VGUS": 0.07,
-                    "VBIL": 0.07
-                }
-                er_value = fallback_er[fund]
-            
-            # Add to DataFrame
-            bond_data.loc[fund, 'Name'] = display_names[fund]
-            bond_data.loc[fund, 'Maturity Range (years)'] = maturity_ranges[fund]
-            bond_data.loc[fund, 'Credit Quality'] = credit_quality[fund]
-            bond_data.loc[fund, 'Current Price ($)'] = round(hist['Close'].iloc[-1], 2) if not hist.empty else np.nan
-            bond_data.loc[fund, 'Expense Ratio (%)'] = round(er_value, 2)
-            bond_data.loc[fund, 'Yield (%)'] = round(yield_value, 2)
-            
+                er_value = FALLBACK_ER[fund]
+
+            return {
+                'fund': fund,
+                'Current Price ($)': price,
+                'Expense Ratio (%)': er_value,
+                'Yield (%)': yield_value
+            }
+
+        # The per-fund .info lookups are independent network calls, so fan
+        # them out across threads and collect as they complete
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(_fetch_one, fund) for fund in bond_funds]
+            rows = [future.result() for future in as_completed(futures)]
+
+        # Overlay the live quote columns on the static metadata in one
+        # join; the index alignment restores canonical fund order
+        live = pd.DataFrame(rows).set_index('fund').rename_axis(None)
+        bond_data = BOND_META.copy().join(live)
+
+        # Round all quote columns in one vectorized pass rather than
+        # calling Python's round() per scalar in the workers
+        numeric_cols = ['Current Price ($)', 'Expense Ratio (%)', 'Yield (%)']
+        bond_data[numeric_cols] = bond_data[numeric_cols].round(2)
+
+        # Persist today's data so later runs (and restarts) skip the fetch
+        if use_cache:
+            try:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                bond_data.to_parquet(cache_file)
+            except Exception:
+                # Caching is best-effort; the live data is still returned
+                pass
+
         return bond_data
-    
+
     except Exception as e:
         # If there's an error fetching data, use fallback data
-        for fund in bond_funds:
-            bond_data.loc[fund, 'Name'] = display_names[fund]
-            bond_data.loc[fund, 'Maturity Range (years)'] = maturity_ranges[fund]
-            bond_data.loc[fund, 'Credit Quality'] = credit_quality[fund]
-            
-            # Fallback values
-            fallback_prices = {
-                "BND": 72.50,
-                "BNDX": 48.75,
-                "VFIDX": 9.40,
-                "VFSUX": 9.60,
-                "VGUS": 60.25,
-                "VBIL": 50.80,
-                "VCORX": 9.01
-            }
-            
-            fallback_yields = {
-                "BND": 4.2,
-                "BNDX": 3.8,
-                "VFIDX": 4.8,
-                "VFSUX": 4.5,
-                "VGUS": 4.3,
-                "VBIL": 4.0,
-                "VCORX": 4.62
-            }
-
-            fallback_er = {
-                "BND": 0.03,
-                "BNDX": 0.07,
-                "VCORX": 0.20,
-                "VFIDX": 0.10,
-                "VFSUX": 0.10,
-                "VGUS": 0.07,
-                "VBIL": 0.07
-            }
-            
-            bond_data.loc[fund, 'Current Price ($)'] = round(fallback_prices[fund], 2)
-            bond_data.loc[fund, 'Expense Ratio (%)'] = round(fallback_er[fund], 2)
-            bond_data.loc[fund, 'Yield (%)'] = round(fallback_yields[fund], 2)
-        
+        bond_data = BOND_META.copy()
+        bond_data['Current Price ($)'] = pd.Series(FALLBACK_PRICES).round(2)
+        bond_data['Expense Ratio (%)'] = pd.Series(FALLBACK_ER).round(2)
+        bond_data['Yield (%)'] = pd.Series(FALLBACK_YIELDS).round(2)
         return bond_data
@@ -2,29 +2,45 @@ import pytest
 import pandas as pd
 import numpy as np
 from unittest.mock import patch
-from bond_utils import get_bond_data
+from bond_utils import get_bond_data, clear_disk_cache
 
 # Mock yfinance for testing get_bond_data
+MOCK_PRICES = {
+    "BND": 72.50,
+    "BNDX": 48.75,
+    "VFIDX": 9.40,
+    "VFSUX": 9.60,
+    "VGUS": 60.25,
+    "VBIL": 50.80,
+    "VCORX": 9.01
+}
+
+class MockFastInfo:
+    """Mimics yfinance FastInfo key semantics: keys() and get() only see
+    the camelCase names, while snake-case access works via __getitem__."""
+    def __init__(self, price):
+        self._data = {'lastPrice': price}
+
+    def keys(self):
+        return self._data.keys()
+
+    def __getitem__(self, key):
+        words = key.split('_')
+        camel = words[0] + ''.join(w.title() for w in words[1:])
+        return self._data[camel]
+
+    def get(self, key, default=None):
+        if key in self.keys():
+            return self[key]
+        return default
+
 class MockTicker:
     def __init__(self, symbol):
         self.symbol = symbol
 
-    def history(self, period):
-        if self.symbol == "BND":
-            return pd.DataFrame({'Close': [72.50]})
-        elif self.symbol == "BNDX":
-            return pd.DataFrame({'Close': [48.75]})
-        elif self.symbol == "VFIDX":
-            return pd.DataFrame({'Close': [9.40]})
-        elif self.symbol == "VFSUX":
-            return pd.DataFrame({'Close': [9.60]})
-        elif self.symbol == "VGUS":
-            return pd.DataFrame({'Close': [60.25]})
-        elif self.symbol == "VBIL":
-            return pd.DataFrame({'Close': [50.80]})
-        elif self.symbol == "VCORX":
-            return pd.DataFrame({'Close': [9.01]})
-        return pd.DataFrame()
+    @property
+    def fast_info(self):
+        return MockFastInfo(MOCK_PRICES[self.symbol])
 
     @property
     def info(self):
@@ -44,9 +60,13 @@ class MockTicker:
             return {'yield': 0.0462, 'expenseRatio': 0.0020}
         return {}
 
-@patch('yfinance.Ticker', new=MockTicker)
+class MockTickers:
+    def __init__(self, symbols):
+        self.tickers = {s: MockTicker(s) for s in symbols.split()}
+
+@patch('yfinance.Tickers', new=MockTickers)
 def test_get_bond_data_success():
-    bond_data = get_bond_data()
+    bond_data = get_bond_data(use_cache=False)
 
     assert isinstance(bond_data, pd.DataFrame)
     assert not bond_data.empty
@@ -56,10 +76,13 @@ def test_get_bond_data_success():
     assert bond_data.loc["BND", "Yield (%)"] == 4.2
     assert bond_data.loc["BND", "Expense Ratio (%)"] == 0.03
     assert bond_data.loc["BNDX", "Current Price ($)"] == 48.75
+    # Maturity midpoints are precomputed for the chart builders
+    assert bond_data.loc["BND", "MaturityMid"] == 7.5
+    assert bond_data.loc["VBIL", "MaturityMid"] == 0.125
 
-@patch('yfinance.Ticker', side_effect=Exception("Test API Error"))
-def test_get_bond_data_fallback(mock_ticker):
-    bond_data = get_bond_data()
+@patch('yfinance.Tickers', side_effect=Exception("Test API Error"))
+def test_get_bond_data_fallback(mock_tickers):
+    bond_data = get_bond_data(use_cache=False)
 
     assert isinstance(bond_data, pd.DataFrame)
     assert not bond_data.empty
@@ -70,3 +93,30 @@ def test_get_bond_data_fallback(mock_ticker):
     assert bond_data.loc["VCORX", "Yield (%)"] == 4.62
     assert bond_data.loc["VCORX", "Current Price ($)"] == 9.01
     assert bond_data.loc["VCORX", "Expense Ratio (%)"] == 0.20
+
+@patch('yfinance.Tickers', new=MockTickers)
+def test_get_bond_data_disk_cache(tmp_path, monkeypatch):
+    import bond_utils
+    monkeypatch.setattr(bond_utils, '_CACHE_DIR', tmp_path / "bonds")
+
+    first = get_bond_data()
+    # One parquet entry written for today's key
+    assert len(list((tmp_path / "bonds").glob("*.parquet"))) == 1
+
+    # A failing fetch path must now be irrelevant: the cache is served
+    with patch('yfinance.Tickers', side_effect=Exception("offline")):
+        second = get_bond_data()
+
+    pd.testing.assert_frame_equal(first, second)
+
+@patch('yfinance.Tickers', new=MockTickers)
+def test_clear_disk_cache(tmp_path, monkeypatch):
+    import bond_utils
+    monkeypatch.setattr(bond_utils, '_CACHE_DIR', tmp_path / "bonds")
+
+    get_bond_data()
+    assert len(list((tmp_path / "bonds").glob("*.parquet"))) == 1
+
+    # The refresh path deletes the entry so the next fetch goes live
+    clear_disk_cache()
+    assert list((tmp_path / "bonds").glob("*.parquet")) == []
@@ -43,10 +43,7 @@ def sample_allocation():
         "VBIL": 0.0
     }
 
-@patch('plotly.graph_objects.Figure.add_trace')
-@patch('plotly.graph_objects.Figure.update_layout')
-@patch('plotly.express.colors.qualitative.Safe', ['red', 'blue', 'green', 'yellow', 'purple', 'orange'])
-def test_create_pie_chart(mock_update_layout, mock_add_trace):
+def test_create_pie_chart():
     allocation = {
         "BND": 0.35,
         "BNDX": 0.30,
@@ -56,57 +53,39 @@ def test_create_pie_chart(mock_update_layout, mock_add_trace):
         "VBIL": 0.0
     }
 
-    create_pie_chart(allocation)
-
-    # Check if add_trace was called with correct data (excluding 0% allocations)
-    mock_add_trace.assert_called_once()
-    args, kwargs = mock_add_trace.call_args
-    assert isinstance(args[0], go.Pie)
-    assert args[0].labels == [f"BND (35.0%)", f"BNDX (30.0%)", f"VFIDX (20.0%)", f"VFSUX (15.0%)"]
-    assert args[0].values == [35.0, 30.0, 20.0, 15.0]
-
-    mock_update_layout.assert_called_once()
-
-@patch('plotly.graph_objects.Figure.add_trace')
-@patch('plotly.graph_objects.Figure.update_layout')
-def test_create_bar_chart(mock_update_layout, mock_add_trace, sample_allocation, sample_bond_data):
-    create_bar_chart(sample_allocation, sample_bond_data)
-
-    # Check if add_trace was called for each non-zero allocation
-    assert mock_add_trace.call_count == 4  # BND, BNDX, VFIDX, VFSUX
-
-    # Verify data for each call
-    expected_funds = ["VFSUX", "VFIDX", "BND", "BNDX"] # Expected order after sorting by maturity
-    expected_allocations = [15.0, 20.0, 35.0, 30.0]
-
-    for i, (args, kwargs) in enumerate(mock_add_trace.call_args_list):
-        assert isinstance(args[0], go.Bar)
-        assert args[0].x[0] == expected_funds[i]
-        assert args[0].y[0] == expected_allocations[i]
-
-    mock_update_layout.assert_called_once()
-
-@patch('plotly.graph_objects.Figure.add_trace')
-@patch('plotly.graph_objects.Figure.update_layout')
-@patch('plotly.express.colors.sequential.Viridis', ['red', 'blue', 'green', 'yellow', 'purple', 'orange'])
-def test_create_ladder_chart(mock_update_layout, mock_add_trace, sample_allocation, sample_bond_data):
-    create_ladder_chart(sample_allocation, sample_bond_data, 1000000)
-
-    # Check if add_trace was called for each non-zero allocation (bars) + 1 for scatter
-    assert mock_add_trace.call_count == 5  # 4 bars + 1 scatter
-
-    # Verify data for bar calls
-    bar_calls = [call for call in mock_add_trace.call_args_list if isinstance(call.args[0], go.Bar)]
-    assert len(bar_calls) == 4
-
-    # Verify data for the scatter call
-    scatter_call = next(call for call in mock_add_trace.call_args_list if isinstance(call.args[0], go.Scatter))
-    args, kwargs = scatter_call
-    assert args[0].mode == 'lines+markers'
-    # The order of maturities in the scatter plot should be sorted
-    expected_x = [2.5, 5.5, 7.5, 8.5] # VFSUX, VFIDX, BND, BNDX (sorted by maturity midpoint)
-    expected_y = [150000.0, 200000.0, 350000.0, 300000.0] # Corresponding amounts
-    assert list(args[0].x) == expected_x
-    assert list(args[0].y) == expected_y
-
-    mock_update_layout.assert_called_once()
\ No newline at end of file
+    fig = create_pie_chart(allocation)
+
+    # One pie trace holding only the non-zero allocations
+    pies = [trace for trace in fig.data if trace.type == 'pie']
+    assert len(pies) == 1
+    assert list(pies[0].labels) == ["BND (35.0%)", "BNDX (30.0%)", "VFIDX (20.0%)", "VFSUX (15.0%)"]
+    assert list(pies[0].values) == [35.0, 30.0, 20.0, 15.0]
+
+def test_create_bar_chart(sample_allocation, sample_bond_data):
+    fig = create_bar_chart(sample_allocation, sample_bond_data)
+
+    # All non-zero allocations collapse into one vectorized bar trace
+    bars = [trace for trace in fig.data if trace.type == 'bar']
+    assert len(bars) == 1
+
+    # Funds are sorted by maturity midpoint
+    assert list(bars[0].x) == ["VFSUX", "VFIDX", "BND", "BNDX"]
+    assert list(bars[0].y) == [15.0, 20.0, 35.0, 30.0]
+
+def test_create_ladder_chart(sample_allocation, sample_bond_data):
+    fig = create_ladder_chart(sample_allocation, sample_bond_data, 1000000)
+
+    # One vectorized bar trace plus the WebGL ladder connector line
+    bars = [trace for trace in fig.data if trace.type == 'bar']
+    scatters = [trace for trace in fig.data if trace.type == 'scattergl']
+    assert len(bars) == 1
+    assert len(scatters) == 1
+
+    # Bars and connector follow maturity order: VFSUX, VFIDX, BND, BNDX
+    expected_x = [2.5, 5.5, 7.5, 8.5]
+    expected_y = [150000.0, 200000.0, 350000.0, 300000.0]
+    assert list(bars[0].x) == expected_x
+    assert list(bars[0].y) == expected_y
+    assert scatters[0].mode == 'lines+markers'
+    assert list(scatters[0].x) == expected_x
+    assert list(scatters[0].y) == expected_y
\ No newline at end of file
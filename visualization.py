@@ -1,17 +1,96 @@
-import plotly.graph_objects as go
-import plotly.express as px
+import functools
+
 import pandas as pd
 import numpy as np
+import streamlit as st
+
+# plotly is imported lazily inside the chart builders: its package init
+# costs ~100ms that the app shouldn't pay until a figure is drawn
+
+# Hash DataFrames by content so cached chart builders can key on bond_data
+_DF_HASH_FUNCS = {
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=True).values.tobytes()
+}
+
+
+@st.cache_data(show_spinner=False)
+def cached_pie_chart(allocation_items):
+    """
+    Memoized pie chart builder.
+
+    Args:
+        allocation_items (tuple): Sorted (fund, weight) pairs, hashable for caching.
+
+    Returns:
+        plotly.graph_objects.Figure: The pie chart figure.
+    """
+    return _pie_figure(allocation_items)
+
+
+@functools.lru_cache(maxsize=32)
+def _pie_figure(allocation_items):
+    """
+    Process-level memo of pie figures keyed on the allocation tuple.
+
+    Works independently of the Streamlit cache, so repeat builds are
+    skipped even when called outside a Streamlit session.
+    """
+    return create_pie_chart(dict(allocation_items))
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def cached_bar_chart(allocation_items, bond_data):
+    """
+    Memoized bar chart builder keyed on allocation and bond data content.
+    """
+    return create_bar_chart(dict(allocation_items), bond_data)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def cached_ladder_chart(allocation_items, bond_data, investment_amount):
+    """
+    Memoized ladder chart builder keyed on allocation, bond data and amount.
+    """
+    return create_ladder_chart(dict(allocation_items), bond_data, investment_amount)
+
+
+def _maturity_midpoints(bond_data, funds):
+    """
+    Compute the numeric midpoint of each fund's maturity range.
+
+    Splits all ranges (e.g. "7-8") in one vectorized string pass; single
+    values come through unchanged via the NaN-skipping mean.
+
+    Args:
+        bond_data (pd.DataFrame): Bond fund information indexed by symbol.
+        funds (list): Fund symbols to compute midpoints for.
+
+    Returns:
+        pd.Series: Midpoint in years for each requested fund.
+    """
+    # Use the midpoints precomputed by bond_utils when available
+    if 'MaturityMid' in bond_data.columns:
+        return bond_data['MaturityMid'].reindex(funds)
+    return (bond_data['Maturity Range (years)']
+            .reindex(funds)
+            .str.split('-', expand=True)
+            .astype(float)
+            .mean(axis=1))
+
 
 def create_pie_chart(allocation):
     """
     Create a pie chart visualization of the bond allocation
     """
+    import plotly.graph_objects as go
+    import plotly.express as px
+
     # Filter out funds with 0 allocation
     filtered_allocation = {k: v for k, v in allocation.items() if v > 0}
 
     labels = list(filtered_allocation.keys())
-    values = [val * 100 for val in filtered_allocation.values()]  # Convert to percentages
+    # Convert to percentages in one array multiply
+    values = np.fromiter(filtered_allocation.values(), dtype=np.float64) * 100
     
     # Create readable labels with percentages
     labels_with_pct = [f"{label} ({val:.1f}%)" for label, val in zip(labels, values)]
@@ -38,7 +117,8 @@ def create_pie_chart(allocation):
             xanchor="center",
             x=0.5
         ),
-        height=500
+        height=500,
+        uirevision='allocation'
     )
     
     return fig
@@ -47,75 +127,64 @@ def create_bar_chart(allocation, bond_data):
     """
     Create a bar chart showing allocation by maturity
     """
+    import plotly.graph_objects as go
+
     # Filter out funds with 0 allocation
     filtered_allocation = {k: v for k, v in allocation.items() if v > 0}
 
-    # Extract maturity ranges and convert to numeric for sorting
-    maturity_data = {}
-    
-    for fund, alloc in filtered_allocation.items():
-        maturity_range = bond_data.loc[fund, 'Maturity Range (years)']
-        # Take the midpoint of the range for sorting
-        maturity_parts = maturity_range.split('-')
-        if len(maturity_parts) == 2:
-            midpoint = (float(maturity_parts[0]) + float(maturity_parts[1])) / 2
-        else:
-            midpoint = float(maturity_parts[0])
-            
-        maturity_data[fund] = {
-            'allocation': alloc * 100,  # Convert to percentage
-            'maturity': midpoint,
-            'maturity_range': maturity_range
-        }
-    
-    # Sort by maturity
-    sorted_funds = sorted(maturity_data.keys(), key=lambda x: maturity_data[x]['maturity'])
-    
-    # Create the bar chart
-    fig = go.Figure()
-    
-    for fund in sorted_funds:
-        fig.add_trace(go.Bar(
-            x=[fund],
-            y=[maturity_data[fund]['allocation']],
-            name=f"{fund} ({maturity_data[fund]['maturity_range']} years)",
-            hovertemplate='%{y:.2f}%<extra></extra>'
-        ))
-    
-    fig.update_layout(
+    # Build the plot data in one vectorized pass over the active funds,
+    # sorted by maturity midpoint
+    funds = list(filtered_allocation.keys())
+    chart_df = pd.DataFrame({
+        'fund': funds,
+        'allocation': np.fromiter(filtered_allocation.values(), dtype=np.float64) * 100,
+        'maturity_range': bond_data['Maturity Range (years)'].reindex(funds).to_numpy(),
+        'maturity': _maturity_midpoints(bond_data, funds).to_numpy()
+    }).sort_values('maturity')
+
+    # Build the single vectorized trace and the layout up front so the
+    # Figure constructor validates the schema once; per-fund maturity
+    # ranges ride along as hover text
+    trace = go.Bar(
+        x=chart_df['fund'].tolist(),
+        y=chart_df['allocation'].tolist(),
+        name='Allocation',
+        text=[f"{fund} ({maturity_range} years)"
+              for fund, maturity_range in zip(chart_df['fund'], chart_df['maturity_range'])],
+        hovertemplate='%{text}: %{y:.2f}%<extra></extra>'
+    )
+
+    layout = go.Layout(
         title_text="Allocation by Bond Maturity",
         xaxis_title="Bond Fund",
         yaxis_title="Allocation (%)",
         barmode='group',
-        height=500
+        height=500,
+        uirevision='maturity'
     )
-    
-    return fig
+
+    return go.Figure(data=[trace], layout=layout)
 
 def create_ladder_chart(allocation, bond_data, investment_amount):
     """
     Create a visualization of the bond ladder structure
     """
+    import plotly.graph_objects as go
+    import plotly.express as px
+
     # Filter out funds with 0 allocation
     filtered_allocation = {k: v for k, v in allocation.items() if v > 0}
 
-    # Prepare data for the chart
+    # Prepare data for the chart; midpoints come from one vectorized parse
     funds = list(filtered_allocation.keys())
-    maturities = []
-    for fund in funds:
-        maturity_range = bond_data.loc[fund, 'Maturity Range (years)']
-        maturity_parts = maturity_range.split('-')
-        if len(maturity_parts) == 2:
-            midpoint = (float(maturity_parts[0]) + float(maturity_parts[1])) / 2
-        else:
-            midpoint = float(maturity_parts[0])
-        maturities.append(midpoint)
-    
-    amounts = [filtered_allocation[fund] * investment_amount for fund in funds]
-    yields = [bond_data.loc[fund, 'Yield (%)'] for fund in funds]
-    
-    # Calculate expected income
-    incomes = [amount * yield_val / 100 for amount, yield_val in zip(amounts, yields)]
+    maturities = _maturity_midpoints(bond_data, funds).to_numpy()
+
+    # Amounts, yields and expected income as array arithmetic rather than
+    # per-fund lookups and zipped Python loops
+    alloc_vec = np.fromiter(filtered_allocation.values(), dtype=np.float64)
+    amounts = alloc_vec * investment_amount
+    yields = bond_data['Yield (%)'].reindex(funds).to_numpy(dtype=np.float64)
+    incomes = amounts * yields / 100.0
     
     # Create DataFrame for the chart
     ladder_df = pd.DataFrame({
@@ -132,41 +201,43 @@ def create_ladder_chart(allocation, bond_data, investment_amount):
     # Create a custom color scale
     colors = px.colors.sequential.Viridis
     
-    # Create the chart
-    fig = go.Figure()
-    
-    # Add bars for each fund
-    for i, row in ladder_df.iterrows():
-        fig.add_trace(go.Bar(
-            x=[row['Maturity']],
-            y=[row['Amount']],
-            name=row['Fund'],
-            text=[f"${row['Amount']:.2f}<br>{row['Fund']}<br>Yield: {row['Yield']:.2f}%<br>Income: ${row['Annual Income']:.2f}"],
+    # All fund bars as one vectorized trace with per-bar colors, plus the
+    # ladder connector line; Scattergl renders on a WebGL canvas the
+    # browser can reuse across reruns
+    maturity_points = ladder_df['Maturity'].tolist()
+    amount_points = ladder_df['Amount'].tolist()
+
+    traces = [
+        go.Bar(
+            x=maturity_points,
+            y=amount_points,
+            name='Funds',
+            text=[f"${amount:.2f}<br>{fund}<br>Yield: {yield_val:.2f}%<br>Income: ${income:.2f}"
+                  for fund, amount, yield_val, income in zip(
+                      ladder_df['Fund'], ladder_df['Amount'],
+                      ladder_df['Yield'], ladder_df['Annual Income'])],
             hoverinfo='text',
-            marker_color=colors[i % len(colors)]
-        ))
-    
-    # Add a line connecting the bars to visualize the ladder
-    # maturity_points = ladder_df['Maturity'].tolist()
-    # amount_points = ladder_df['Amount'].tolist()
-    
-    # fig.add_trace(go.Scatter(
-    #     x=maturity_points,
-    #     y=amount_points,
-    #     mode='lines+markers',
-    #     line=dict(color='rgba(0,0,0,0.5)', width=2, dash='dash'),
-    #     marker=dict(size=10, symbol='circle', color='rgba(0,0,0,0.8)'),
-    #     name='Ladder Structure',
-    #     hoverinfo='skip'
-    # ))
-    
-    # Update layout
-    fig.update_layout(
+            marker_color=[colors[i % len(colors)] for i in range(len(ladder_df))]
+        ),
+        go.Scattergl(
+            x=maturity_points,
+            y=amount_points,
+            mode='lines+markers',
+            line=dict(color='rgba(0,0,0,0.5)', width=2, dash='dash'),
+            marker=dict(size=10, symbol='circle', color='rgba(0,0,0,0.8)'),
+            name='Ladder Structure',
+            hoverinfo='skip'
+        )
+    ]
+
+    # Build the layout alongside so the Figure constructor validates once
+    layout = go.Layout(
         #title='Bond Ladder Structure',
         xaxis_title='Maturity (Years)',
         yaxis_title='Investment Amount ($)',
         barmode='group',
         height=600,
+        uirevision='ladder',
         showlegend=True,
         legend=dict(
             orientation="h",
@@ -176,5 +247,5 @@ def create_ladder_chart(allocation, bond_data, investment_amount):
             x=0.5
         )
     )
-    
-    return fig
+
+    return go.Figure(data=traces, layout=layout)